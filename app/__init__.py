@@ -5,9 +5,13 @@ load_dotenv()
 
 def create_app():
     app = Flask(__name__)
-    
+
+    # Use orjson for request parsing and jsonify
+    from app.json_provider import ORJSONProvider
+    app.json = ORJSONProvider(app)
+
     # Register blueprints here
     from app.routes import main
     app.register_blueprint(main)
-    
+
     return app 
\ No newline at end of file
@@ -0,0 +1,312 @@
+import os
+import json
+import time
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional
+from app.logger import setup_logger
+
+logger = setup_logger('cache')
+
+def connect_redis():
+    """
+    Connect to Redis if REDIS_URL is configured, otherwise return None
+    """
+    redis_url = os.getenv('REDIS_URL')
+    if not redis_url:
+        return None
+    try:
+        import redis
+        client = redis.Redis.from_url(redis_url)
+        client.ping()
+        logger.info("Cache connected to Redis backend")
+        return client
+    except Exception as e:
+        logger.warning("Redis unavailable, falling back to in-process cache: %s", str(e))
+        return None
+
+class LLMCache:
+    """
+    In-process exact-match cache for LLM responses
+
+    Keys are SHA-256 digests of the normalized request payload, so identical
+    requests skip the OpenAI call entirely. Entries are evicted LRU-first once
+    max_size is reached, and lazily on read once they are older than ttl_seconds.
+
+    If a REDIS_URL environment variable is set, entries are also written
+    through to Redis so multiple workers can share the cache.
+    """
+
+    def __init__(self, max_size: int = None, ttl_seconds: int = None):
+        self.max_size = max_size or int(os.getenv('LLM_CACHE_MAX_SIZE', '256'))
+        self.ttl_seconds = ttl_seconds or int(os.getenv('LLM_CACHE_TTL_SECONDS', '3600'))
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self._redis = connect_redis()
+
+    @staticmethod
+    def make_key(data: Dict[str, Any], model: str) -> str:
+        """
+        Build a deterministic cache key from the request payload
+
+        Args:
+            data (Dict[str, Any]): Validated request data
+            model (str): Model identifier used for generation
+
+        Returns:
+            str: SHA-256 hex digest of the normalized payload
+        """
+        payload = {
+            'tone': data['tone'].strip().lower(),
+            'contactName': data['contactName'].strip(),
+            'companyName': data['companyName'].strip(),
+            'summary': data['summary'].strip(),
+            'transcript': (data.get('transcript') or '').strip(),
+            'model': model
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response, returning None on miss or expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if time.time() - stored_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    logger.debug("LLM cache hit for key %s", key[:12])
+                    return value
+                del self._entries[key]
+
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(f'llm_cache:{key}')
+                if raw is not None:
+                    value = json.loads(raw)
+                    with self._lock:
+                        self.hits += 1
+                        self._entries[key] = (time.time(), value)
+                        self._entries.move_to_end(key)
+                    logger.debug("LLM cache hit in Redis for key %s", key[:12])
+                    return value
+            except Exception as e:
+                logger.warning("Redis read failed: %s", str(e))
+
+        with self._lock:
+            self.misses += 1
+        logger.debug("LLM cache miss for key %s", key[:12])
+        return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a response, evicting the least recently used entry if full
+        """
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        if self._redis is not None:
+            try:
+                self._redis.setex(f'llm_cache:{key}', self.ttl_seconds, json.dumps(value))
+            except Exception as e:
+                logger.warning("Redis write failed: %s", str(e))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss counters for monitoring
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+class SemanticCache:
+    """
+    Embedding-similarity cache for near-duplicate email requests
+
+    Stores a unit-normalized embedding vector per cached response and answers
+    lookups whose cosine similarity meets the threshold, so paraphrased
+    summaries of the same call reuse an existing generation instead of paying
+    for a new one. Entries persist to disk as JSON and are written through to
+    Redis when REDIS_URL is configured.
+    """
+
+    def __init__(self, path: str = None, threshold: float = None, max_size: int = None):
+        self.path = path or os.getenv('SEMANTIC_CACHE_PATH', os.path.join('data', 'semantic_cache.json'))
+        self.threshold = threshold or float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.92'))
+        self.max_size = max_size or int(os.getenv('SEMANTIC_CACHE_MAX_SIZE', '256'))
+        self._entries = []
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self._redis = connect_redis()
+        # Highest Redis-assigned entry id this worker has seen; ids come from
+        # a shared INCR counter, so position survives list trims
+        self._last_redis_id = 0
+        self._load()
+        self._sync_from_redis()
+
+    def _load(self):
+        """
+        Load persisted entries from disk, starting empty if none exist
+        """
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+                self._last_redis_id = max((entry.get('id', 0) for entry in self._entries), default=0)
+                logger.info("Loaded %d semantic cache entries from %s", len(self._entries), self.path)
+        except Exception as e:
+            logger.warning("Could not load semantic cache from %s: %s", self.path, str(e))
+            self._entries = []
+
+    def _save(self):
+        """
+        Persist entries to disk so the cache survives restarts
+        """
+        try:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+        except Exception as e:
+            logger.warning("Could not persist semantic cache to %s: %s", self.path, str(e))
+
+    def _sync_from_redis(self):
+        """
+        Pull entries other workers have written to Redis since the last sync
+
+        Each Gunicorn worker has its own process memory, so without this a hit
+        stored by one worker would be invisible to the rest. Entries live in a
+        shared Redis list and each worker appends on write.
+
+        Every entry carries a monotonically increasing id from a shared INCR
+        counter, so "what have I seen" is independent of list positions and
+        keeps working after LTRIM shifts them.
+        """
+        if self._redis is None:
+            return
+        try:
+            # Cheap peek: if the newest entry's id is one we have seen,
+            # nothing new was written since the last sync
+            raw_last = self._redis.lindex('semantic_cache:entries', -1)
+            if raw_last is None:
+                return
+            if json.loads(raw_last).get('id', 0) <= self._last_redis_id:
+                return
+
+            raw_entries = self._redis.lrange('semantic_cache:entries', 0, -1)
+            added = 0
+            with self._lock:
+                for raw in raw_entries:
+                    entry = json.loads(raw)
+                    entry_id = entry.get('id', 0)
+                    if entry_id <= self._last_redis_id:
+                        continue
+                    self._entries.append(entry)
+                    added += 1
+                    if entry_id > self._last_redis_id:
+                        self._last_redis_id = entry_id
+                while len(self._entries) > self.max_size:
+                    self._entries.pop(0)
+            logger.debug("Synced %d semantic cache entries from Redis", added)
+        except Exception as e:
+            logger.warning("Redis sync failed: %s", str(e))
+
+    @staticmethod
+    def _normalize(vector):
+        """
+        Scale a vector to unit length so dot product equals cosine similarity
+        """
+        norm = sum(v * v for v in vector) ** 0.5
+        if norm == 0:
+            return vector
+        return [v / norm for v in vector]
+
+    def lookup(self, vector, transcript_length: int) -> Optional[Dict[str, Any]]:
+        """
+        Find the closest cached response by cosine similarity
+
+        Args:
+            vector: Embedding of the incoming request text
+            transcript_length (int): Length of the incoming transcript, used to
+                skip entries whose transcript differs by more than 30%
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached response data on a hit, None otherwise
+        """
+        self._sync_from_redis()
+
+        query = self._normalize(vector)
+        best_score = -1.0
+        best_entry = None
+
+        with self._lock:
+            for entry in self._entries:
+                stored_length = entry.get('transcript_length', 0)
+                longest = max(transcript_length, stored_length)
+                if longest and abs(transcript_length - stored_length) / longest > 0.3:
+                    continue
+                score = sum(a * b for a, b in zip(query, entry['vector']))
+                if score > best_score:
+                    best_score = score
+                    best_entry = entry
+
+            if best_entry is not None and best_score >= self.threshold:
+                self.hits += 1
+                logger.debug("Semantic cache hit (similarity: %.3f)", best_score)
+                return best_entry
+            self.misses += 1
+
+        logger.debug("Semantic cache miss (best similarity: %.3f)", best_score)
+        return None
+
+    def add(self, vector, response: Dict[str, Any], transcript_length: int) -> None:
+        """
+        Store a generated response with its embedding, evicting oldest first
+        """
+        entry = {
+            'vector': self._normalize(vector),
+            'response': response,
+            'transcript_length': transcript_length,
+            'stored_at': time.time()
+        }
+
+        if self._redis is not None:
+            try:
+                entry['id'] = self._redis.incr('semantic_cache:next_id')
+            except Exception as e:
+                logger.warning("Redis write failed: %s", str(e))
+
+        with self._lock:
+            self._entries.append(entry)
+            while len(self._entries) > self.max_size:
+                self._entries.pop(0)
+            self._save()
+            if entry.get('id'):
+                self._last_redis_id = max(self._last_redis_id, entry['id'])
+
+        if self._redis is not None and entry.get('id'):
+            try:
+                self._redis.rpush('semantic_cache:entries', json.dumps(entry))
+                self._redis.ltrim('semantic_cache:entries', -self.max_size, -1)
+            except Exception as e:
+                logger.warning("Redis write failed: %s", str(e))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss counters for monitoring
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+# Shared cache instances used by generate_email_content
+llm_cache = LLMCache()
+semantic_cache = SemanticCache()
@@ -0,0 +1,21 @@
+import orjson
+from flask.json.provider import JSONProvider
+
+class ORJSONProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson
+
+    Replaces the pure-Python serializer used by request.json and jsonify with
+    orjson, which parses and writes bytes directly and is several times faster
+    on the email-sized payloads this API handles.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
@@ -0,0 +1,62 @@
+import time
+from threading import Lock
+from app.logger import setup_logger
+
+logger = setup_logger('resilience')
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker is open"""
+
+class CircuitBreaker:
+    """
+    Simple thread-safe circuit breaker
+
+    After fail_max consecutive failures the breaker opens and rejects calls
+    immediately for reset_timeout seconds, so a struggling upstream gets
+    fast 503s instead of workers piling onto a dead connection. After the
+    timeout one call is let through; success closes the breaker again.
+    """
+
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: int = 30):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = Lock()
+
+    def check(self) -> None:
+        """
+        Raise CircuitOpenError if the breaker is open and not yet cooled down
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.time() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(f'{self.name} circuit breaker is open')
+            # Cooled down: allow a probe call through
+            logger.info("Circuit breaker %s half-open, allowing probe call", self.name)
+            self._opened_at = None
+            self._failures = self.fail_max - 1
+
+    def record_success(self) -> None:
+        """
+        Reset the failure count after a successful call
+        """
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """
+        Count a failure and open the breaker once fail_max is reached
+        """
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max and self._opened_at is None:
+                self._opened_at = time.time()
+                logger.warning("Circuit breaker %s opened after %d consecutive failures",
+                               self.name, self._failures)
+
+# Shared breaker guarding all OpenRouter completion calls
+openai_breaker = CircuitBreaker('openai', fail_max=5, reset_timeout=30)
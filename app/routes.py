@@ -1,6 +1,18 @@
-from flask import Blueprint, jsonify, request
+import json
+from dataclasses import asdict
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from app.logger import setup_logger
-from app.utils import validate_email_request, generate_email_content
+from app.utils import (
+    validate_email_request,
+    generate_email_content,
+    generate_emails_concurrent,
+    stream_email_content,
+    batch_mode_available,
+    submit_email_batch,
+    get_batch_results
+)
+from app.cache import llm_cache
+from app.resilience import CircuitOpenError
 
 # Initialize logger
 logger = setup_logger('routes')
@@ -11,7 +23,7 @@ main = Blueprint('main', __name__)
 def health_check():
     """Health check endpoint to verify API is running"""
     logger.debug("Health check request received")
-    return jsonify({'status': 'healthy'})
+    return jsonify({'status': 'healthy', 'cache': llm_cache.stats()})
 
 @main.route('/api/generate-email', methods=['POST'])
 def generate_email():
@@ -41,24 +53,163 @@ def generate_email():
     try:
         logger.info("Received email generation request")
         data = request.json
-        logger.debug(f"Request data: {data}")
 
         # Validate request data
-        logger.debug("Validating request data")
         validation_error = validate_email_request(data)
         if validation_error:
-            logger.warning(f"Validation failed: {validation_error}")
+            logger.warning("Validation failed: %s", validation_error)
             return jsonify({'error': validation_error}), 400
 
-        # Generate email content
-        logger.info(f"Generating email for {data['contactName']} from {data['companyName']}")
+        # Generate email content through the pooled sync client: a single
+        # generation gains nothing from the async path under asgiref, which
+        # would build (and abandon) a fresh connection pool per request
+        logger.info("Generating email for %s from %s", data['contactName'], data['companyName'])
         email_response = generate_email_content(data)
         
         logger.info("Successfully generated email")
-        logger.debug(f"Generated email - Subject: {email_response['subject']}, Body length: {len(email_response['body'])}")
-        
         return jsonify(email_response)
 
+    except CircuitOpenError:
+        logger.warning("Rejecting request: OpenAI circuit breaker is open")
+        return jsonify({'error': 'Email generation temporarily unavailable'}), 503
     except Exception as e:
-        logger.error(f"Error generating email: {str(e)}", exc_info=True)
+        logger.error("Error generating email: %s", str(e), exc_info=True)
         return jsonify({'error': 'Failed to generate email'}), 500
+
+@main.route('/api/generate-email-stream', methods=['POST'])
+def generate_email_stream():
+    """
+    Generate a follow-up email and stream it via Server-Sent Events
+
+    Accepts the same JSON payload as /api/generate-email. Emits 'data' events
+    containing {"delta": str} as tokens arrive, then a final 'done' event
+    with the structured email response.
+    """
+    try:
+        logger.info("Received streaming email generation request")
+        data = request.json
+
+        validation_error = validate_email_request(data)
+        if validation_error:
+            logger.warning("Validation failed: %s", validation_error)
+            return jsonify({'error': validation_error}), 400
+
+        def generate():
+            try:
+                for event in stream_email_content(data):
+                    if 'done' in event:
+                        yield f"event: done\ndata: {json.dumps(event['done'])}\n\n"
+                    else:
+                        yield f"data: {json.dumps(event)}\n\n"
+            except Exception as e:
+                logger.error("Error streaming email: %s", str(e), exc_info=True)
+                yield f"event: error\ndata: {json.dumps({'error': 'Failed to generate email'})}\n\n"
+
+        return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
+    except Exception as e:
+        logger.error("Error generating email: %s", str(e), exc_info=True)
+        return jsonify({'error': 'Failed to generate email'}), 500
+
+@main.route('/api/generate-emails', methods=['POST'])
+async def generate_emails():
+    """
+    Generate emails for multiple leads in parallel
+
+    Expected JSON payload:
+    {
+        "requests": [ {"tone": str, "contactName": str, ...}, ... ]
+    }
+
+    Unlike /api/generate-emails-batch this returns synchronously: the
+    generations are fanned out concurrently and the response contains one
+    entry per request, either the email or an error.
+    """
+    try:
+        logger.info("Received concurrent email generation request")
+        data = request.json
+
+        requests_data = data.get('requests') if isinstance(data, dict) else None
+        if not isinstance(requests_data, list) or not requests_data:
+            logger.warning("Concurrent request missing non-empty 'requests' list")
+            return jsonify({'error': "Request must include a non-empty 'requests' list"}), 400
+
+        for index, item in enumerate(requests_data):
+            validation_error = validate_email_request(item)
+            if validation_error:
+                logger.warning("Validation failed for item %d: %s", index, validation_error)
+                return jsonify({'error': f'Request {index}: {validation_error}'}), 400
+
+        results = await generate_emails_concurrent(requests_data)
+        emails = [
+            {'error': 'Failed to generate email'} if isinstance(result, BaseException) else asdict(result)
+            for result in results
+        ]
+
+        logger.info("Successfully generated %d of %d emails",
+                    sum(1 for e in emails if 'error' not in e), len(emails))
+        return jsonify({'emails': emails})
+
+    except Exception as e:
+        logger.error("Error generating emails concurrently: %s", str(e), exc_info=True)
+        return jsonify({'error': 'Failed to generate emails'}), 500
+
+@main.route('/api/generate-emails-batch', methods=['POST'])
+def generate_emails_batch():
+    """
+    Submit a bulk email generation job via the OpenAI Batch API
+
+    Expected JSON payload:
+    {
+        "requests": [ {"tone": str, "contactName": str, ...}, ... ]
+    }
+
+    Returns:
+        JSON response with the batch id to poll via /api/batch/<batch_id>
+    """
+    try:
+        if not batch_mode_available():
+            logger.warning("Rejecting batch request: OPENAI_API_KEY not configured")
+            return jsonify({'error': 'Batch mode requires OPENAI_API_KEY to be configured'}), 503
+
+        logger.info("Received batch email generation request")
+        data = request.json
+
+        requests_data = data.get('requests') if isinstance(data, dict) else None
+        if not isinstance(requests_data, list) or not requests_data:
+            logger.warning("Batch request missing non-empty 'requests' list")
+            return jsonify({'error': "Request must include a non-empty 'requests' list"}), 400
+
+        for index, item in enumerate(requests_data):
+            validation_error = validate_email_request(item)
+            if validation_error:
+                logger.warning("Validation failed for batch item %d: %s", index, validation_error)
+                return jsonify({'error': f'Request {index}: {validation_error}'}), 400
+
+        batch_id = submit_email_batch(requests_data)
+        return jsonify({'batchId': batch_id, 'status': 'submitted'}), 202
+
+    except Exception as e:
+        logger.error("Error submitting email batch: %s", str(e), exc_info=True)
+        return jsonify({'error': 'Failed to submit email batch'}), 500
+
+@main.route('/api/batch/<batch_id>', methods=['GET'])
+def get_batch(batch_id):
+    """
+    Poll a batch job's status and return the generated emails on completion
+
+    Returns:
+        JSON response with the batch status, plus an 'emails' array once the
+        batch has completed
+    """
+    try:
+        if not batch_mode_available():
+            logger.warning("Rejecting batch poll: OPENAI_API_KEY not configured")
+            return jsonify({'error': 'Batch mode requires OPENAI_API_KEY to be configured'}), 503
+
+        logger.debug("Polling batch %s", batch_id)
+        return jsonify(get_batch_results(batch_id))
+
+    except Exception as e:
+        logger.error("Error retrieving batch %s: %s", batch_id, str(e), exc_info=True)
+        return jsonify({'error': 'Failed to retrieve batch'}), 500
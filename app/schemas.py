@@ -0,0 +1,20 @@
+from typing import Optional
+from typing_extensions import Annotated
+from pydantic import BaseModel, Field, PositiveInt, StringConstraints
+
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+class EmailRequest(BaseModel):
+    """
+    Schema for an email generation request
+
+    Validation runs in pydantic-core (Rust), replacing the hand-written
+    isinstance/strip chain with a single model_validate call.
+    """
+    tone: NonEmptyStr
+    contactName: NonEmptyStr
+    companyName: NonEmptyStr
+    summary: NonEmptyStr
+    transcript: Optional[str] = None
+    deterministic: bool = False
+    max_tokens: Optional[PositiveInt] = Field(default=None, le=1000)
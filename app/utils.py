@@ -1,12 +1,113 @@
 import os
 import re
-from openai import OpenAI
+import io
+import json
+import atexit
+import asyncio
+import weakref
+import httpx
+from dataclasses import dataclass, asdict
+from openai import (
+    OpenAI,
+    AsyncOpenAI,
+    APIConnectionError,
+    APITimeoutError,
+    RateLimitError,
+    InternalServerError
+)
+from pydantic import ValidationError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from app.logger import setup_logger
-from typing import Dict, Any, Optional, TypedDict
+from app.cache import llm_cache, semantic_cache
+from app.resilience import openai_breaker
+from app.schemas import EmailRequest
+from typing import Dict, Any, Optional
 
 logger = setup_logger('utils')
 
-class EmailResponse(TypedDict):
+MODEL = "deepseek/deepseek-prover-v2:free"
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Batch jobs run against the OpenAI Batch API directly (OpenRouter exposes no
+# files/batches endpoints), so they need an OpenAI-hosted model id
+BATCH_MODEL = os.getenv("OPENAI_BATCH_MODEL", "gpt-4o-mini")
+
+# Optional OpenRouter attribution headers, sent with every completion when
+# configured (https://openrouter.ai/docs)
+EXTRA_HEADERS = {
+    key: value for key, value in {
+        'HTTP-Referer': os.getenv('APP_URL'),
+        'X-Title': os.getenv('APP_TITLE'),
+    }.items() if value
+}
+
+# Token budget for generated emails: typical outputs are ~300 tokens, so the
+# decode window stays tight by default and widens only for long transcripts or
+# an explicit per-request override
+DEFAULT_MAX_TOKENS = 400
+LONG_TRANSCRIPT_MAX_TOKENS = 600
+LONG_TRANSCRIPT_THRESHOLD = 2048
+MAX_TOKENS_CEILING = 1000
+STOP_SEQUENCES = ["\n\n\n", "---"]
+
+def resolve_max_tokens(data: Dict[str, Any]) -> int:
+    """
+    Pick the max_tokens budget for a request
+
+    Args:
+        data (Dict[str, Any]): Validated request data
+
+    Returns:
+        int: Explicit 'max_tokens' override (clamped to the ceiling) when
+            provided, a raised budget for transcripts over 2 KB, otherwise
+            the default
+    """
+    override = data.get('max_tokens')
+    if isinstance(override, int) and override > 0:
+        return min(override, MAX_TOKENS_CEILING)
+    if len(data.get('transcript') or '') > LONG_TRANSCRIPT_THRESHOLD:
+        return LONG_TRANSCRIPT_MAX_TOKENS
+    return DEFAULT_MAX_TOKENS
+
+# Pre-compiled pattern for parse_email_response so the regex engine is not
+# re-compiled on every request
+SUBJECT_PATTERN = re.compile(r'Subject:\s*(.*?)(?:\n|$)')
+
+# Markers used by the linear body scan in parse_email_response
+BODY_GREETINGS = ('Hi', 'Hello', 'Dear')
+BODY_SIGN_OFF = 'Best regards,'
+
+def _extract_body(response_text: str) -> str:
+    """
+    Extract the email body with a single linear scan
+
+    Finds the earliest greeting marker and the following sign-off without
+    regex backtracking, falling back to the full text when no greeting is
+    present.
+
+    Args:
+        response_text (str): Raw email response text
+
+    Returns:
+        str: Extracted email body
+    """
+    positions = [i for i in (response_text.find(g) for g in BODY_GREETINGS) if i >= 0]
+    if not positions:
+        return response_text.strip()
+
+    start = min(positions)
+    end = response_text.find(BODY_SIGN_OFF, start)
+    if end >= 0:
+        return response_text[start:end + len(BODY_SIGN_OFF)].strip()
+    return response_text[start:].strip()
+
+@dataclass(slots=True, frozen=True)
+class EmailResponse:
+    """
+    Structured email generation result
+
+    A fixed-layout slots dataclass rather than a dict: construction skips
+    per-key hashing and orjson serializes dataclasses natively.
+    """
     subject: str
     body: str
     summary: str
@@ -14,144 +115,383 @@ class EmailResponse(TypedDict):
     companyName: str
     tone: str
 
+# Shared sync client so the underlying httpx connection pool (and its TCP+TLS
+# handshakes to openrouter.ai) is reused across requests instead of being
+# rebuilt per call. Async clients are bound per event loop (see
+# get_async_openai_client) because their connections cannot outlive the loop
+# they were created on.
+_client = None
+_direct_client = None
+_async_clients = weakref.WeakKeyDictionary()
+
 def get_openai_client():
     """
-    Initialize and return OpenAI client
+    Initialize and return a shared OpenAI client
+
+    The client is created once at first use with a pooled httpx.Client so
+    keep-alive connections to OpenRouter survive between requests.
     """
-    try:
-        logger.debug("Initializing OpenAI client with OpenRouter API")
-        client = OpenAI(
+    global _client
+    if _client is None:
+        try:
+            logger.debug("Initializing OpenAI client with OpenRouter API")
+            _client = OpenAI(
+                base_url="https://openrouter.ai/api/v1",
+                api_key=os.getenv("OPENROUTER_API_KEY"),
+                http_client=httpx.Client(
+                    transport=httpx.HTTPTransport(
+                        http2=True,
+                        retries=2,
+                        limits=httpx.Limits(max_keepalive_connections=50, max_connections=50)
+                    ),
+                    timeout=60
+                ),
+            )
+            logger.debug("OpenAI client initialized successfully")
+        except Exception as e:
+            logger.error("Failed to initialize OpenAI client: %s", str(e))
+            raise
+    return _client
+
+def get_openai_direct_client():
+    """
+    Initialize and return a shared client for api.openai.com, or None
+
+    OpenRouter does not serve the embeddings (or files/batches) endpoints, so
+    features that need them go through a separate OpenAI-direct client keyed
+    by OPENAI_API_KEY. Returns None when that key is not configured, which
+    callers treat as the feature being disabled.
+    """
+    global _direct_client
+    if _direct_client is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            return None
+        logger.debug("Initializing OpenAI client for api.openai.com")
+        _direct_client = OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=2,
+                    limits=httpx.Limits(max_keepalive_connections=50, max_connections=50)
+                ),
+                timeout=60
+            ),
+        )
+    return _direct_client
+
+def get_async_openai_client():
+    """
+    Initialize and return an AsyncOpenAI client bound to the running event loop
+
+    An httpx.AsyncClient's pooled connections die with the event loop that
+    created them — reusing one client across loops fails with "Event loop is
+    closed" — so clients are cached per loop and dropped automatically when
+    their loop is garbage collected. This only pays off where many coroutines
+    share one loop, i.e. the generate_emails_concurrent fan-out; single
+    generations go through the pooled sync client instead.
+
+    Must be called from within a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        logger.debug("Initializing AsyncOpenAI client with OpenRouter API")
+        client = AsyncOpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=os.getenv("OPENROUTER_API_KEY"),
+            http_client=httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=2,
+                    limits=httpx.Limits(max_keepalive_connections=50, max_connections=50)
+                ),
+                timeout=60
+            ),
         )
-        logger.debug("OpenAI client initialized successfully")
-        return client
-    except Exception as e:
-        logger.error(f"Failed to initialize OpenAI client: {str(e)}")
-        raise
+        _async_clients[loop] = client
+        logger.debug("AsyncOpenAI client initialized successfully")
+    return client
+
+def _close_clients():
+    """
+    Close the shared clients on shutdown to release pooled connections
 
-def call_openai(client, system_prompt, prompt):
+    Async clients whose event loop has already been closed cannot release
+    their connections cleanly; those are left to garbage collection.
+    """
+    for shared_client in (_client, _direct_client):
+        if shared_client is not None:
+            try:
+                shared_client.close()
+            except Exception as e:
+                logger.warning("Error closing OpenAI client: %s", str(e))
+    for loop, client in list(_async_clients.items()):
+        if loop.is_closed():
+            continue
+        try:
+            asyncio.run(client.close())
+        except Exception as e:
+            logger.warning("Error closing AsyncOpenAI client: %s", str(e))
+
+atexit.register(_close_clients)
+
+# Transient upstream errors worth retrying with backoff
+RETRYABLE_ERRORS = (APIConnectionError, APITimeoutError, RateLimitError, InternalServerError)
+
+OPENAI_RETRY = retry(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(4),
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    reraise=True
+)
+
+@OPENAI_RETRY
+def _create_completion(client, system_prompt, prompt, temperature, max_tokens):
+    """
+    Issue a chat completion, retrying transient errors with jittered backoff
+    """
+    return client.chat.completions.create(
+        extra_body={},
+        extra_headers=EXTRA_HEADERS,
+        model=MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stop=STOP_SEQUENCES
+    )
+
+def call_openai(client, system_prompt, prompt, temperature=0.7, max_tokens=DEFAULT_MAX_TOKENS):
     """
     Call OpenAI API to generate content based on the provided prompts
-    
+
+    Transient 429/5xx/timeout errors are retried with exponential backoff;
+    repeated failures open a circuit breaker that fails fast for 30 s
+    instead of holding the worker.
+
     Args:
         client: OpenAI client instance
         system_prompt (str): System prompt for the AI
         prompt (str): User prompt for the AI
-        
+        temperature (float): Sampling temperature for generation
+        max_tokens (int): Decode budget for the completion
+
     Returns:
         str: Generated content
     """
+    openai_breaker.check()
     try:
-        logger.debug("Calling OpenAI API with system prompt and user prompt")
-        logger.debug(f"System prompt length: {len(system_prompt)}")
-        logger.debug(f"User prompt length: {len(prompt)}")
-        
-        completion = client.chat.completions.create(
+        completion = _create_completion(client, system_prompt, prompt, temperature, max_tokens)
+
+        response = completion.choices[0].message.content
+        logger.debug("Received response from OpenAI API (length: %d)", len(response))
+        openai_breaker.record_success()
+        return response
+    except Exception as e:
+        openai_breaker.record_failure()
+        logger.error("Error calling OpenAI API: %s", str(e))
+        raise
+
+def get_embedding(text: str):
+    """
+    Get an embedding vector for the given text
+
+    Embeddings go through the OpenAI-direct client; OpenRouter does not host
+    an embeddings endpoint.
+
+    Args:
+        text (str): Text to embed
+
+    Returns:
+        list: Embedding vector
+    """
+    client = get_openai_direct_client()
+    response = client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+    return response.data[0].embedding
+
+def _semantic_cache_text(data: Dict[str, Any]) -> str:
+    """
+    Build the text that represents a request for semantic cache purposes
+    """
+    return f"{data['tone']}|{data['companyName']}|{data['summary']}|{data.get('transcript') or ''}"
+
+def semantic_lookup(data: Dict[str, Any]) -> Optional[EmailResponse]:
+    """
+    Look up a semantically similar cached email for the given request
+
+    Embeds the request and searches the semantic cache; on a hit, the cached
+    email is reused with the new contact and company names patched in.
+
+    Args:
+        data (Dict[str, Any]): Validated request data
+
+    Returns:
+        Optional[EmailResponse]: Reused email response on a hit, None otherwise
+    """
+    if get_openai_direct_client() is None:
+        logger.debug("Semantic cache disabled: OPENAI_API_KEY not configured")
+        return None
+
+    try:
+        vector = get_embedding(_semantic_cache_text(data))
+        transcript_length = len(data.get('transcript') or '')
+        entry = semantic_cache.lookup(vector, transcript_length)
+        if entry is None:
+            return None
+
+        cached = entry['response']
+        subject = cached['subject']
+        body = cached['body']
+
+        # Patch the new contact and company into the cached text
+        if cached['contactName'] and cached['contactName'] != data['contactName']:
+            subject = subject.replace(cached['contactName'], data['contactName'])
+            body = body.replace(cached['contactName'], data['contactName'])
+        if cached['companyName'] and cached['companyName'] != data['companyName']:
+            subject = subject.replace(cached['companyName'], data['companyName'])
+            body = body.replace(cached['companyName'], data['companyName'])
+
+        return EmailResponse(
+            subject=subject,
+            body=body,
+            summary=data['summary'],
+            contactName=data['contactName'],
+            companyName=data['companyName'],
+            tone=data['tone']
+        )
+    except Exception as e:
+        logger.warning("Semantic cache lookup failed, generating fresh email: %s", str(e))
+        return None
+
+def semantic_store(data: Dict[str, Any], email_response: EmailResponse) -> None:
+    """
+    Store a freshly generated email in the semantic cache
+    """
+    if get_openai_direct_client() is None:
+        return
+
+    try:
+        vector = get_embedding(_semantic_cache_text(data))
+        semantic_cache.add(vector, asdict(email_response), len(data.get('transcript') or ''))
+    except Exception as e:
+        logger.warning("Could not store email in semantic cache: %s", str(e))
+
+async def call_openai_async(system_prompt, prompt, temperature=0.7, max_tokens=DEFAULT_MAX_TOKENS):
+    """
+    Call OpenAI API asynchronously to generate content
+
+    Uses the shared AsyncOpenAI client so the event loop can multiplex many
+    in-flight generations over one connection pool.
+
+    Transient 429/5xx/timeout errors are retried with exponential backoff;
+    repeated failures open the shared circuit breaker.
+
+    Args:
+        system_prompt (str): System prompt for the AI
+        prompt (str): User prompt for the AI
+        temperature (float): Sampling temperature for generation
+        max_tokens (int): Decode budget for the completion
+
+    Returns:
+        str: Generated content
+    """
+    @OPENAI_RETRY
+    async def create_completion():
+        client = get_async_openai_client()
+        return await client.chat.completions.create(
             extra_body={},
-            model="deepseek/deepseek-prover-v2:free",
+            extra_headers=EXTRA_HEADERS,
+            model=MODEL,
             messages=[
                 {
                     "role": "system",
                     "content": system_prompt
                 },
                 {
-                    "role": "user", 
+                    "role": "user",
                     "content": prompt
                 }
             ],
-            temperature=0.7,
-            max_tokens=1000
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop=STOP_SEQUENCES
         )
-        
+
+    openai_breaker.check()
+    try:
+        completion = await create_completion()
+
         response = completion.choices[0].message.content
-        logger.debug(f"Successfully received response from OpenAI API (length: {len(response)})")
+        logger.debug("Received async response from OpenAI API (length: %d)", len(response))
+        openai_breaker.record_success()
         return response
     except Exception as e:
-        logger.error(f"Error calling OpenAI API: {str(e)}")
+        openai_breaker.record_failure()
+        logger.error("Error calling OpenAI API: %s", str(e))
         raise
 
 def validate_email_request(data: Dict[str, Any]) -> Optional[str]:
     """
-    Validate the email generation request data
-    
+    Validate the email generation request data against the EmailRequest schema
+
+    Validation happens in pydantic-core rather than a chain of Python-level
+    isinstance checks.
+
     Args:
         data (Dict[str, Any]): Request data to validate
-        
+
     Returns:
         Optional[str]: Error message if validation fails, None if validation passes
     """
-    logger.debug("Starting email request validation")
-    
-    required_fields = ['tone', 'contactName', 'companyName', 'summary']
-    for field in required_fields:
-        if field not in data:
-            logger.warning(f"Missing required field: {field}")
-            return f'Missing required field: {field}'
-    
-    # Validate tone
-    if not isinstance(data['tone'], str) or not data['tone'].strip():
-        logger.warning("Invalid tone: must be a non-empty string")
-        return 'Tone must be a non-empty string'
-    
-    # Validate contact name
-    if not isinstance(data['contactName'], str) or not data['contactName'].strip():
-        logger.warning("Invalid contact name: must be a non-empty string")
-        return 'Contact name must be a non-empty string'
-    
-    # Validate company name
-    if not isinstance(data['companyName'], str) or not data['companyName'].strip():
-        logger.warning("Invalid company name: must be a non-empty string")
-        return 'Company name must be a non-empty string'
-    
-    # Validate summary
-    if not isinstance(data['summary'], str) or not data['summary'].strip():
-        logger.warning("Invalid summary: must be a non-empty string")
-        return 'Summary must be a non-empty string'
-    
-    # Validate transcript if provided
-    if 'transcript' in data and not isinstance(data['transcript'], str):
-        logger.warning("Invalid transcript: must be a string if provided")
-        return 'Transcript must be a string if provided'
-    
-    logger.debug("Email request validation passed successfully")
-    return None
+    try:
+        EmailRequest.model_validate(data)
+        return None
+    except ValidationError as e:
+        error = e.errors()[0]
+        field = '.'.join(str(part) for part in error['loc']) or 'request'
+        message = f"{field}: {error['msg']}"
+        logger.warning("Request validation failed: %s", message)
+        return message
 
 def parse_email_response(response_text: str, form_data: Dict[str, Any]) -> EmailResponse:
     """
     Parse the email response into a structured format
-    
+
     Args:
         response_text (str): Raw email response text
-        form_data (Dict[str, Any]): Original form data
-        
+        form_data (Dict[str, Any]): Original form data; fields that are
+            missing (e.g. a batch payload file lost to an ephemeral disk)
+            come back empty rather than failing the parse
+
     Returns:
         EmailResponse: Structured email response
     """
-    logger.debug("Parsing email response")
-    
     # Extract subject
-    subject_match = re.search(r'Subject:\s*(.*?)(?:\n|$)', response_text)
+    subject_match = SUBJECT_PATTERN.search(response_text)
     subject = subject_match.group(1).strip() if subject_match else 'Follow-up on our conversation'
-    logger.debug(f"Extracted subject: {subject}")
-    
+
     # Extract body
-    body_match = re.search(r'(?:Hi|Hello|Dear).*?(?:Best regards,|$)', response_text, re.DOTALL)
-    body = body_match.group(0).strip() if body_match else response_text
-    logger.debug(f"Extracted body length: {len(body)}")
-    
+    body = _extract_body(response_text)
+
     # Construct response
-    response = {
-        'subject': subject,
-        'body': body,
-        'summary': form_data['summary'],
-        'contactName': form_data['contactName'],
-        'companyName': form_data['companyName'],
-        'tone': form_data['tone']
-    }
-    
-    logger.debug("Successfully parsed email response")
-    return response
+    return EmailResponse(
+        subject=subject,
+        body=body,
+        summary=form_data.get('summary', ''),
+        contactName=form_data.get('contactName', ''),
+        companyName=form_data.get('companyName', ''),
+        tone=form_data.get('tone', '')
+    )
 
 def generate_email_content(data: Dict[str, Any]) -> EmailResponse:
     """
@@ -164,18 +504,31 @@ def generate_email_content(data: Dict[str, Any]) -> EmailResponse:
         EmailResponse: Structured email response
     """
     try:
-        logger.debug("Starting email content generation")
         from app.prompts import generate_email_system_prompt, construct_email_prompt
-        
-        # Get OpenAI client
-        logger.debug("Getting OpenAI client")
+
+        # Deterministic requests use temperature 0 so identical payloads can be
+        # answered straight from the cache without an OpenAI call
+        deterministic = bool(data.get('deterministic'))
+        cache_key = None
+        if deterministic:
+            cache_key = llm_cache.make_key(data, MODEL)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached email response")
+                return EmailResponse(**cached)
+
+        # Fall back to the semantic cache for paraphrased near-duplicates.
+        # Deterministic requests skip it: they are served and cached by the
+        # exact-match layer, and a semantic hit from another request's
+        # temperature-0.7 output would break the deterministic contract.
+        if not deterministic:
+            semantic_hit = semantic_lookup(data)
+            if semantic_hit is not None:
+                logger.info("Returning semantically cached email response")
+                return semantic_hit
+
         client = get_openai_client()
-        
-        # Get prompts
-        logger.debug("Generating system prompt")
         system_prompt = generate_email_system_prompt()
-        
-        logger.debug("Constructing user prompt")
         user_prompt = construct_email_prompt(
             tone=data['tone'],
             contact_name=data['contactName'],
@@ -184,16 +537,351 @@ def generate_email_content(data: Dict[str, Any]) -> EmailResponse:
             transcript=data.get('transcript')
         )
         
-        # Generate email
-        logger.debug("Calling OpenAI to generate email content")
-        generated_email = call_openai(client, system_prompt, user_prompt)
-        
-        logger.debug(f"Successfully generated email content (length: {len(generated_email)})")
-        
+        temperature = 0 if deterministic else 0.7
+        generated_email = call_openai(client, system_prompt, user_prompt,
+                                      temperature=temperature, max_tokens=resolve_max_tokens(data))
+
+        logger.debug("Generated email content (length: %d)", len(generated_email))
+
         # Parse the response
-        return parse_email_response(generated_email, data)
-        
+        email_response = parse_email_response(generated_email, data)
+
+        if cache_key is not None:
+            llm_cache.set(cache_key, asdict(email_response))
+        else:
+            semantic_store(data, email_response)
+
+        return email_response
+
+    except Exception as e:
+        logger.error("Error generating email content: %s", str(e))
+        raise
+
+async def generate_emails_concurrent(datas: list, max_concurrency: int = 20) -> list:
+    """
+    Generate emails for multiple leads concurrently
+
+    Fans the requests out with asyncio.gather under a semaphore, so the
+    wall-clock time for N leads approaches a single request's latency while
+    staying under the provider's rate limit.
+
+    Args:
+        datas (list): List of validated email request payloads
+        max_concurrency (int): Maximum number of in-flight generations
+
+    Returns:
+        list: EmailResponse per request, or the raised exception for
+            requests that failed
+    """
+    logger.info("Generating %d emails concurrently (max %d in flight)", len(datas), max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def generate_one(data):
+        async with semaphore:
+            return await generate_email_content_async(data)
+
+    return await asyncio.gather(*[generate_one(data) for data in datas], return_exceptions=True)
+
+def stream_email_content(data: Dict[str, Any]):
+    """
+    Generate email content as a stream of chunks
+
+    Yields {'delta': str} events as tokens arrive from OpenAI so clients see
+    output at time-to-first-token instead of waiting for the full completion,
+    then a final {'done': EmailResponse} event with the parsed email. Cache
+    hits yield the whole body as a single delta.
+
+    Args:
+        data (Dict[str, Any]): Request data containing email parameters
+
+    Yields:
+        Dict[str, Any]: Streaming events for the route to forward as SSE
+    """
+    from app.prompts import generate_email_system_prompt, construct_email_prompt
+
+    deterministic = bool(data.get('deterministic'))
+    cache_key = None
+    if deterministic:
+        cache_key = llm_cache.make_key(data, MODEL)
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Streaming cached email response")
+            yield {'delta': cached['body']}
+            yield {'done': cached}
+            return
+
+    # Deterministic requests skip the semantic layer (see
+    # generate_email_content)
+    if not deterministic:
+        semantic_hit = semantic_lookup(data)
+        if semantic_hit is not None:
+            logger.info("Streaming semantically cached email response")
+            yield {'delta': semantic_hit.body}
+            yield {'done': asdict(semantic_hit)}
+            return
+
+    client = get_openai_client()
+    system_prompt = generate_email_system_prompt()
+    user_prompt = construct_email_prompt(
+        tone=data['tone'],
+        contact_name=data['contactName'],
+        company_name=data['companyName'],
+        summary=data['summary'],
+        transcript=data.get('transcript')
+    )
+
+    temperature = 0 if deterministic else 0.7
+
+    # Retry only the stream creation: transient 429/5xx surface here, and
+    # retrying is safe before the first chunk has been yielded to the client
+    @OPENAI_RETRY
+    def create_stream():
+        return client.chat.completions.create(
+            extra_body={},
+            extra_headers=EXTRA_HEADERS,
+            model=MODEL,
+            messages=[
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": user_prompt
+                }
+            ],
+            temperature=temperature,
+            max_tokens=resolve_max_tokens(data),
+            stop=STOP_SEQUENCES,
+            stream=True
+        )
+
+    openai_breaker.check()
+    try:
+        stream = create_stream()
+
+        chunks = []
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                chunks.append(delta)
+                yield {'delta': delta}
+    except Exception:
+        openai_breaker.record_failure()
+        raise
+    openai_breaker.record_success()
+
+    generated_email = ''.join(chunks)
+    logger.debug("Finished streaming email content (length: %d)", len(generated_email))
+
+    email_response = parse_email_response(generated_email, data)
+
+    if cache_key is not None:
+        llm_cache.set(cache_key, asdict(email_response))
+    else:
+        semantic_store(data, email_response)
+
+    yield {'done': asdict(email_response)}
+
+BATCH_DATA_DIR = os.path.join('data', 'batches')
+
+def _save_batch_requests(batch_id: str, requests_data: list) -> None:
+    """
+    Persist the original request payloads so batch results can be parsed later
+    """
+    if not os.path.exists(BATCH_DATA_DIR):
+        os.makedirs(BATCH_DATA_DIR)
+    with open(os.path.join(BATCH_DATA_DIR, f'{batch_id}.json'), 'w', encoding='utf-8') as f:
+        json.dump(requests_data, f, ensure_ascii=False)
+
+def _load_batch_requests(batch_id: str) -> Optional[list]:
+    """
+    Load the original request payloads for a submitted batch
+    """
+    filepath = os.path.join(BATCH_DATA_DIR, f'{batch_id}.json')
+    if not os.path.exists(filepath):
+        return None
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def batch_mode_available() -> bool:
+    """
+    Whether the OpenAI Batch API is usable in this deployment
+    """
+    return get_openai_direct_client() is not None
+
+def submit_email_batch(requests_data: list) -> str:
+    """
+    Submit a bulk email generation job via the OpenAI Batch API
+
+    Builds a JSONL file with one /v1/chat/completions request per lead and
+    uploads it as a batch job, which trades synchronous delivery for 50%
+    lower cost and higher rate limits. Batch jobs go through the
+    OpenAI-direct client with BATCH_MODEL; OpenRouter hosts neither the
+    files/batches endpoints nor OpenAI-acceptable model ids.
+
+    Args:
+        requests_data (list): List of validated email request payloads
+
+    Returns:
+        str: The batch job id to poll for results
+    """
+    try:
+        from app.prompts import generate_email_system_prompt, construct_email_prompt
+
+        client = get_openai_direct_client()
+        if client is None:
+            raise RuntimeError('Batch mode requires OPENAI_API_KEY to be configured')
+
+        logger.info("Submitting batch of %d email requests", len(requests_data))
+        system_prompt = generate_email_system_prompt()
+
+        lines = []
+        for index, data in enumerate(requests_data):
+            user_prompt = construct_email_prompt(
+                tone=data['tone'],
+                contact_name=data['contactName'],
+                company_name=data['companyName'],
+                summary=data['summary'],
+                transcript=data.get('transcript')
+            )
+            lines.append(json.dumps({
+                'custom_id': f'email-{index}',
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': {
+                    'model': BATCH_MODEL,
+                    'messages': [
+                        {'role': 'system', 'content': system_prompt},
+                        {'role': 'user', 'content': user_prompt}
+                    ],
+                    'temperature': 0.7,
+                    'max_tokens': resolve_max_tokens(data),
+                    'stop': STOP_SEQUENCES,
+                    # Batch requests hit OpenAI directly, so steer its
+                    # server-side prompt cache: requests sharing a tone share
+                    # the static instruction prefix
+                    'prompt_cache_key': f"email-{data['tone'].strip().lower()}"
+                }
+            }, ensure_ascii=False))
+
+        input_file = client.files.create(
+            file=io.BytesIO('\n'.join(lines).encode('utf-8')),
+            purpose='batch'
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h'
+        )
+
+        _save_batch_requests(batch.id, requests_data)
+        logger.info("Submitted batch job %s", batch.id)
+        return batch.id
+    except Exception as e:
+        logger.error("Error submitting email batch: %s", str(e))
+        raise
+
+def get_batch_results(batch_id: str) -> Dict[str, Any]:
+    """
+    Poll a batch job and return parsed emails once it completes
+
+    Args:
+        batch_id (str): Batch job id returned by submit_email_batch
+
+    Returns:
+        Dict[str, Any]: {'status': ...} while running, plus an 'emails' list
+            of EmailResponse objects once the batch has completed
+    """
+    try:
+        client = get_openai_direct_client()
+        if client is None:
+            raise RuntimeError('Batch mode requires OPENAI_API_KEY to be configured')
+
+        batch = client.batches.retrieve(batch_id)
+        logger.debug("Batch %s status: %s", batch_id, batch.status)
+
+        if batch.status != 'completed':
+            return {'status': batch.status}
+
+        requests_data = _load_batch_requests(batch_id) or []
+        output = client.files.content(batch.output_file_id)
+
+        emails = []
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            index = int(result['custom_id'].split('-')[1])
+            form_data = requests_data[index] if index < len(requests_data) else {}
+            content = result['response']['body']['choices'][0]['message']['content']
+            emails.append(parse_email_response(content, form_data))
+
+        logger.info("Batch %s completed with %d emails", batch_id, len(emails))
+        return {'status': batch.status, 'emails': emails}
+    except Exception as e:
+        logger.error("Error retrieving batch %s: %s", batch_id, str(e))
+        raise
+
+async def generate_email_content_async(data: Dict[str, Any]) -> EmailResponse:
+    """
+    Generate email content using OpenAI without blocking the event loop
+
+    Mirrors generate_email_content but awaits the OpenAI call on the shared
+    async client, so one worker can service many generations concurrently.
+    Blocking cache helpers run in a thread to keep the loop free.
+
+    Args:
+        data (Dict[str, Any]): Request data containing email parameters
+
+    Returns:
+        EmailResponse: Structured email response
+    """
+    try:
+        from app.prompts import generate_email_system_prompt, construct_email_prompt
+
+        deterministic = bool(data.get('deterministic'))
+        cache_key = None
+        if deterministic:
+            cache_key = llm_cache.make_key(data, MODEL)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached email response")
+                return EmailResponse(**cached)
+
+        # Deterministic requests skip the semantic layer (see
+        # generate_email_content)
+        if not deterministic:
+            semantic_hit = await asyncio.to_thread(semantic_lookup, data)
+            if semantic_hit is not None:
+                logger.info("Returning semantically cached email response")
+                return semantic_hit
+
+        system_prompt = generate_email_system_prompt()
+        user_prompt = construct_email_prompt(
+            tone=data['tone'],
+            contact_name=data['contactName'],
+            company_name=data['companyName'],
+            summary=data['summary'],
+            transcript=data.get('transcript')
+        )
+
+        temperature = 0 if deterministic else 0.7
+        generated_email = await call_openai_async(system_prompt, user_prompt,
+                                                  temperature=temperature, max_tokens=resolve_max_tokens(data))
+
+        logger.debug("Generated email content (length: %d)", len(generated_email))
+
+        email_response = parse_email_response(generated_email, data)
+
+        if cache_key is not None:
+            llm_cache.set(cache_key, asdict(email_response))
+        else:
+            await asyncio.to_thread(semantic_store, data, email_response)
+
+        return email_response
+
     except Exception as e:
-        logger.error(f"Error generating email content: {str(e)}")
+        logger.error("Error generating email content: %s", str(e))
         raise
 
@@ -1,8 +1,10 @@
 from flask import Flask
 from flask_cors import CORS
 from app.routes import main
+from app.json_provider import ORJSONProvider
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app, resources={r"/api/*": {"origins": ["*"]}})
 app.register_blueprint(main)
 